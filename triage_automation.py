@@ -9,18 +9,27 @@ Usage:
     python triage_automation.py                  # Dry run (preview only)
     python triage_automation.py --execute        # Actually assign issues
     python triage_automation.py --issue PROF-23  # Process specific issue
+    python triage_automation.py --no-batch       # Classify without the Message Batches API
 """
 
 import os
 import csv
-import json
+import functools
+import hashlib
+import pickle
+import re
+import sys
+import tempfile
+import time
 import argparse
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import anthropic
-import requests
+import httpx
+import orjson
 
 # =============================================================================
 # CONFIGURATION
@@ -28,48 +37,153 @@ import requests
 
 LINEAR_API_URL = "https://api.linear.app/graphql"
 LINEAR_TEAM_KEY = "PROF"  # Product Feedback & Requests team key
+# Issues per page. Linear rejects queries above 10,000 complexity points; an issue
+# with MAX_PROMPT_LABELS labels costs ~25 points, so a full page stays near 6,250.
+LINEAR_PAGE_SIZE = 250
+MAX_CONCURRENT_ISSUES = 8  # Issues with API calls in flight at once
 
 # Paths to CSV files with topic-to-owner mapping
 SCRIPT_DIR = Path(__file__).parent
 BUCKETS_CSV = SCRIPT_DIR / "Product Feedback Buckets & Features" / "Feedback Buckets-Table 1.csv"
 FEATURES_CSV = SCRIPT_DIR / "Product Feedback Buckets & Features" / "Specific Features-Table 1.csv"
 
+# On-disk cache for parsed CSV data and other per-run lookups
+CACHE_DIR = Path.home() / ".cache" / "linear-triage"
+CACHE_VERSION = 1  # Bump when the format of cached data changes
+BUCKETS_CACHE = CACHE_DIR / "buckets.pkl"
+TEAM_CACHE = CACHE_DIR / "team.json"
+CLASSIFICATION_CACHE = CACHE_DIR / "classifications.pkl"
+CLASSIFICATION_CACHE_MAX_ENTRIES = 1000
+TEAM_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Claude model settings
+CLAUDE_MODEL = "claude-haiku-4-5-20251001"
+CLAUDE_MAX_TOKENS = 300
+CLASSIFY_TOOL_NAME = "classify"
+
+# Prompt size limits - longer descriptions keep their head and tail only
+DESCRIPTION_MAX_CHARS = 2000
+DESCRIPTION_HEAD_CHARS = 1500
+DESCRIPTION_TAIL_CHARS = 500
+MAX_PROMPT_LABELS = 20
+BATCH_POLL_INTERVAL = 10  # seconds between Message Batches status checks
+BATCH_MAX_WAIT = 30 * 60  # seconds before an unfinished batch is cancelled
+
 # =============================================================================
 # TOPIC-TO-OWNER MAPPING
 # =============================================================================
 
-def load_bucket_mapping() -> dict[str, str]:
-    """Load the bucket-to-owner mapping from CSV files."""
+def _write_cache(path: Path, data: bytes) -> None:
+    """Atomically write data to path. Cache write failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _load_buckets() -> tuple[dict[str, str], str]:
+    """
+    Load buckets from CSV. Returns (bucket-to-owner mapping, prompt descriptions).
+
+    The parsed result is cached on disk keyed by the CSV's path and mtime and
+    CACHE_VERSION, so the CSV is only re-parsed after it (or the parser) changes.
+    """
+    cache_key = (str(BUCKETS_CSV), os.stat(BUCKETS_CSV).st_mtime_ns, CACHE_VERSION)
+    try:
+        with open(BUCKETS_CACHE, "rb") as f:
+            cached_key, mapping, descriptions = pickle.load(f)
+        if cached_key == cache_key:
+            return mapping, descriptions
+    except Exception:
+        # Missing or unreadable cache - fall through to parsing the CSV
+        pass
+
+    mapping, descriptions = _parse_buckets_csv()
+    _write_cache(BUCKETS_CACHE, pickle.dumps((cache_key, mapping, descriptions)))
+    return mapping, descriptions
+
+
+def _parse_buckets_csv() -> tuple[dict[str, str], str]:
+    """Parse the buckets CSV in a single pass."""
     mapping = {}
+    buckets = []
 
-    # Load main buckets
     with open(BUCKETS_CSV, encoding="utf-8") as f:
         reader = csv.DictReader(f, delimiter=";")
         for row in reader:
             name = row.get("Name", "").strip()
             owner = row.get("Owner", "").strip()
-            if name and owner:
+            note = row.get("Note", "").strip()
+            if not name:
+                continue
+            if owner:
                 mapping[name.lower()] = owner
+            if note:
+                buckets.append(f"- {name}: {note}")
+            else:
+                buckets.append(f"- {name}")
 
-    return mapping
+    return mapping, "\n".join(buckets)
+
+
+def load_bucket_mapping() -> dict[str, str]:
+    """Load the bucket-to-owner mapping from CSV files."""
+    return _load_buckets()[0]
 
 
 def get_bucket_descriptions() -> str:
     """Get formatted bucket descriptions for the AI prompt."""
-    buckets = []
+    return _load_buckets()[1]
 
-    with open(BUCKETS_CSV, encoding="utf-8") as f:
+
+# Extra title keywords that unambiguously name a bucket
+BUCKET_KEYWORD_SYNONYMS = {
+    "extractor": "components",
+    "extractors": "components",
+    "writer": "components",
+    "writers": "components",
+    "scheduler": "flows / scheduler",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def load_keyword_index() -> dict[str, str]:
+    """
+    Build the title keyword -> bucket index used to skip AI classification.
+
+    Keywords are the bucket names, the specific feature names (mapped to their
+    parent bucket) and BUCKET_KEYWORD_SYNONYMS.
+    """
+    bucket_mapping = load_bucket_mapping()
+    index = {name: name for name in bucket_mapping}
+
+    with open(FEATURES_CSV, encoding="utf-8") as f:
         reader = csv.DictReader(f, delimiter=";")
         for row in reader:
-            name = row.get("Name", "").strip()
-            note = row.get("Note", "").strip()
-            if name:
-                if note:
-                    buckets.append(f"- {name}: {note}")
-                else:
-                    buckets.append(f"- {name}")
+            name = (row.get("Name") or "").strip().lower()
+            parent = (row.get("Parent") or "").strip().lower()
+            if name and parent in bucket_mapping:
+                index.setdefault(name, parent)
+
+    for keyword, bucket in BUCKET_KEYWORD_SYNONYMS.items():
+        index.setdefault(keyword, bucket)
 
-    return "\n".join(buckets)
+    return index
+
+
+def build_keyword_pattern(keyword_index: dict[str, str]) -> re.Pattern:
+    """Compile a whole-word pattern for all keywords, preferring the longest match."""
+    keywords = sorted(keyword_index, key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b")
 
 
 # Owner name normalization (CSV names -> Linear display names)
@@ -84,6 +198,9 @@ FEATURE_OWNER_OVERRIDES = {
     "native datatypes": "Zuzana Bednarova",  # Exception: belongs to Zuzana, not Storage owner
 }
 
+# Single pattern matching any override feature, so each title is scanned once
+FEATURE_OVERRIDE_RE = re.compile("|".join(map(re.escape, FEATURE_OWNER_OVERRIDES)))
+
 # Label to add when AI confidence is low (different possible owners)
 NEEDS_REVIEW_LABEL = "needs-review"
 
@@ -97,6 +214,28 @@ def normalize_owner_name(name: str) -> str:
 # LINEAR API
 # =============================================================================
 
+def _load_cached_team_id(team_key: str) -> Optional[str]:
+    """Return the team ID cached on disk for team_key, if still fresh."""
+    try:
+        entry = orjson.loads(TEAM_CACHE.read_bytes())[team_key]
+        if time.time() - entry["cached_at"] < TEAM_CACHE_TTL:
+            return entry["id"]
+    except Exception:
+        # Missing, stale-format or unreadable cache
+        pass
+    return None
+
+
+def _save_cached_team_id(team_key: str, team_id: str) -> None:
+    """Persist the team ID for team_key to the on-disk cache."""
+    try:
+        cache = orjson.loads(TEAM_CACHE.read_bytes())
+    except Exception:
+        cache = {}
+    cache[team_key] = {"id": team_id, "cached_at": time.time()}
+    _write_cache(TEAM_CACHE, orjson.dumps(cache))
+
+
 class LinearClient:
     """Simple Linear GraphQL API client."""
 
@@ -106,138 +245,110 @@ class LinearClient:
             "Authorization": api_key,
             "Content-Type": "application/json",
         }
+        # Persistent HTTP/2 connection shared by all API calls
+        self._http = httpx.AsyncClient(http2=True, headers=self.headers, timeout=30.0)
+        # Per-run caches keyed by team key
+        self._team_ids: dict[str, str] = {}
+        self._team_members: dict[str, list[dict]] = {}
+
+    async def __aenter__(self) -> "LinearClient":
+        return self
 
-    def _query(self, query: str, variables: dict = None) -> dict:
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection."""
+        await self._http.aclose()
+
+    async def _query(self, query: str, variables: dict = None) -> dict:
         """Execute a GraphQL query."""
-        response = requests.post(
+        response = await self._http.post(
             LINEAR_API_URL,
-            headers=self.headers,
-            json={"query": query, "variables": variables or {}},
+            content=orjson.dumps({"query": query, "variables": variables or {}}),
         )
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
         if "errors" in result:
             raise Exception(f"GraphQL errors: {result['errors']}")
         return result["data"]
 
-    def get_triage_issues(self, team_key: str = LINEAR_TEAM_KEY) -> list[dict]:
-        """Get all issues in Triage status for the team."""
+    async def _query_all(self, query: str, variables: dict, get_connection) -> list[dict]:
+        """
+        Execute a paginated GraphQL query and return all nodes.
+
+        The query must accept $first and $after variables; get_connection picks
+        the paginated connection (with nodes and pageInfo) out of the response data.
+        """
+        nodes = []
+        cursor = None
+        while True:
+            data = await self._query(query, {**variables, "first": LINEAR_PAGE_SIZE, "after": cursor})
+            connection = get_connection(data)
+            nodes.extend(connection["nodes"])
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return nodes
+            cursor = page_info["endCursor"]
+
+    async def get_triage_issues(self, team_key: str = LINEAR_TEAM_KEY) -> list[dict]:
+        """Get all unassigned issues in Triage status for the team."""
+        # Filter issues by team key directly, so no separate team lookup is needed
         query = """
-        query GetTriageIssues($teamKey: String!) {
-            team(id: $teamKey) {
-                id
-                issues(filter: { state: { type: { eq: "triage" } } }) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        description
-                        url
-                        assignee {
-                            id
-                            name
-                        }
-                        labels {
-                            nodes {
-                                name
-                            }
-                        }
-                    }
+        query GetTriageIssues($teamKey: String!, $first: Int!, $after: String, $labelsFirst: Int!) {
+            issues(
+                filter: {
+                    team: { key: { eq: $teamKey } }
+                    state: { type: { eq: "triage" } }
+                    assignee: { null: true }
                 }
-            }
-        }
-        """
-        # First get team ID from key
-        team_query = """
-        query GetTeam {
-            teams(filter: { key: { eq: "PROF" } }) {
+                first: $first
+                after: $after
+            ) {
                 nodes {
                     id
-                    name
-                }
-            }
-        }
-        """
-        team_data = self._query(team_query)
-        team_id = team_data["teams"]["nodes"][0]["id"]
-
-        # Now get issues
-        issues_query = """
-        query GetTriageIssues($teamId: String!) {
-            team(id: $teamId) {
-                issues(filter: { state: { type: { eq: "triage" } } }) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        description
-                        url
-                        assignee {
-                            id
+                    identifier
+                    title
+                    description
+                    labels(first: $labelsFirst) {
+                        nodes {
                             name
                         }
-                        labels {
-                            nodes {
-                                name
-                            }
-                        }
                     }
                 }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
             }
         }
         """
-        data = self._query(issues_query, {"teamId": team_id})
-        return data["team"]["issues"]["nodes"]
+        return await self._query_all(
+            query,
+            {"teamKey": team_key, "labelsFirst": MAX_PROMPT_LABELS},
+            lambda data: data["issues"],
+        )
 
-    def get_issue_by_identifier(self, identifier: str) -> dict:
+    async def get_issue_by_identifier(self, identifier: str) -> dict:
         """Get a specific issue by its identifier (e.g., PROF-23)."""
-        query = """
-        query GetIssue($identifier: String!) {
-            issue(id: $identifier) {
-                id
-                identifier
-                title
-                description
-                url
-                assignee {
-                    id
-                    name
-                }
-                labels {
-                    nodes {
-                        name
-                    }
-                }
-                state {
-                    name
-                    type
-                }
-            }
-        }
-        """
         # Linear API uses issue filter for identifier lookup
         search_query = """
-        query SearchIssue($filter: IssueFilter!) {
+        query SearchIssue($filter: IssueFilter!, $labelsFirst: Int!) {
             issues(filter: $filter, first: 1) {
                 nodes {
                     id
                     identifier
                     title
                     description
-                    url
                     assignee {
                         id
                         name
                     }
-                    labels {
+                    labels(first: $labelsFirst) {
                         nodes {
                             name
                         }
                     }
-                    state {
-                        name
-                        type
-                    }
                 }
             }
         }
@@ -247,38 +358,51 @@ class LinearClient:
         team_key = parts[0]
         number = int(parts[1])
 
-        data = self._query(search_query, {
+        data = await self._query(search_query, {
             "filter": {
                 "team": {"key": {"eq": team_key}},
                 "number": {"eq": number}
-            }
+            },
+            "labelsFirst": MAX_PROMPT_LABELS,
         })
         issues = data["issues"]["nodes"]
         if not issues:
             raise ValueError(f"Issue {identifier} not found")
         return issues[0]
 
-    def get_team_members(self) -> list[dict]:
+    async def get_team_members(self, team_key: str = LINEAR_TEAM_KEY) -> list[dict]:
         """Get all members of the Product Feedback team."""
+        if team_key in self._team_members:
+            return self._team_members[team_key]
+
         query = """
-        query GetTeamMembers {
-            teams(filter: { key: { eq: "PROF" } }) {
+        query GetTeamMembers($teamKey: String!, $first: Int!, $after: String) {
+            teams(filter: { key: { eq: $teamKey } }, first: 1) {
                 nodes {
-                    members {
+                    members(first: $first, after: $after) {
                         nodes {
                             id
                             name
                             email
                         }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
                     }
                 }
             }
         }
         """
-        data = self._query(query)
-        return data["teams"]["nodes"][0]["members"]["nodes"]
+        members = await self._query_all(
+            query,
+            {"teamKey": team_key},
+            lambda data: data["teams"]["nodes"][0]["members"],
+        )
+        self._team_members[team_key] = members
+        return members
 
-    def assign_issue(self, issue_id: str, assignee_id: str, label_ids: list[str] = None) -> dict:
+    async def assign_issue(self, issue_id: str, assignee_id: str, label_ids: list[str] = None) -> dict:
         """Assign an issue to a user, optionally adding labels."""
         input_data = {"assigneeId": assignee_id}
         if label_ids:
@@ -290,23 +414,14 @@ class LinearClient:
                 success
                 issue {
                     id
-                    identifier
-                    assignee {
-                        name
-                    }
-                    labels {
-                        nodes {
-                            name
-                        }
-                    }
                 }
             }
         }
         """
-        data = self._query(mutation, {"issueId": issue_id, "input": input_data})
+        data = await self._query(mutation, {"issueId": issue_id, "input": input_data})
         return data["issueUpdate"]
 
-    def add_comment(self, issue_id: str, body: str) -> dict:
+    async def add_comment(self, issue_id: str, body: str) -> dict:
         """Add a comment to an issue."""
         mutation = """
         mutation AddComment($issueId: String!, $body: String!) {
@@ -314,15 +429,14 @@ class LinearClient:
                 success
                 comment {
                     id
-                    body
                 }
             }
         }
         """
-        data = self._query(mutation, {"issueId": issue_id, "body": body})
+        data = await self._query(mutation, {"issueId": issue_id, "body": body})
         return data["commentCreate"]
 
-    def get_or_create_label(self, team_id: str, label_name: str) -> str:
+    async def get_or_create_label(self, team_id: str, label_name: str) -> str:
         """Get a label by name or create it if it doesn't exist. Returns label ID."""
         # First try to find existing label
         query = """
@@ -335,7 +449,7 @@ class LinearClient:
             }
         }
         """
-        data = self._query(query, {"teamId": team_id, "labelName": label_name})
+        data = await self._query(query, {"teamId": team_id, "labelName": label_name})
         labels = data["issueLabels"]["nodes"]
         if labels:
             return labels[0]["id"]
@@ -352,22 +466,33 @@ class LinearClient:
             }
         }
         """
-        data = self._query(mutation, {"teamId": team_id, "name": label_name})
+        data = await self._query(mutation, {"teamId": team_id, "name": label_name})
         return data["issueLabelCreate"]["issueLabel"]["id"]
 
-    def get_team_id(self) -> str:
-        """Get the team ID for PROF team."""
+    async def get_team_id(self, team_key: str = LINEAR_TEAM_KEY) -> str:
+        """Get the team ID for the Product Feedback team (cached on disk for TEAM_CACHE_TTL)."""
+        if team_key in self._team_ids:
+            return self._team_ids[team_key]
+
+        team_id = _load_cached_team_id(team_key)
+        if team_id:
+            self._team_ids[team_key] = team_id
+            return team_id
+
         query = """
-        query GetTeam {
-            teams(filter: { key: { eq: "PROF" } }) {
+        query GetTeam($teamKey: String!) {
+            teams(filter: { key: { eq: $teamKey } }, first: 1) {
                 nodes {
                     id
                 }
             }
         }
         """
-        data = self._query(query)
-        return data["teams"]["nodes"][0]["id"]
+        data = await self._query(query, {"teamKey": team_key})
+        team_id = data["teams"]["nodes"][0]["id"]
+        _save_cached_team_id(team_key, team_id)
+        self._team_ids[team_key] = team_id
+        return team_id
 
 
 # =============================================================================
@@ -384,22 +509,63 @@ class ClassificationResult:
     reasoning: str
 
 
-def classify_issue(
-    client: anthropic.Anthropic,
-    issue: dict,
-    bucket_descriptions: str,
-    bucket_names: list[str],
-    bucket_mapping: dict[str, str],
-) -> ClassificationResult:
-    """Use Claude to classify an issue into a bucket with confidence scoring."""
+def classify_by_keywords(
+    title: str,
+    keyword_index: dict[str, str],
+    keyword_pattern: re.Pattern,
+) -> Optional[ClassificationResult]:
+    """Classify an issue from its title alone when keywords point to exactly one bucket."""
+    matches = keyword_pattern.findall(title.lower())
+    buckets = {keyword_index[keyword] for keyword in matches}
+    if len(buckets) != 1:
+        return None
+    return ClassificationResult(
+        primary_bucket=buckets.pop(),
+        secondary_bucket=None,
+        confidence="high",
+        reasoning=f"Keyword match on title: '{matches[0]}'",
+    )
 
-    title = issue.get("title", "")
-    description = issue.get("description", "") or ""
-    labels = [l["name"] for l in issue.get("labels", {}).get("nodes", [])]
+
+def classification_cache_key(issue: dict, bucket_descriptions: str) -> str:
+    """Key an AI classification by everything that goes into its prompt."""
+    _, prompt = build_prompt(issue)
+    content = "\0".join([str(CACHE_VERSION), CLAUDE_MODEL, bucket_descriptions, prompt])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_classification_cache() -> dict[str, dict]:
+    """
+    Load raw classify tool inputs saved by previous runs.
+
+    Entries are stored before parse_classification so that owner-dependent
+    adjustments are recomputed against the current bucket mapping on every run.
+    """
+    try:
+        with open(CLASSIFICATION_CACHE, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable cache
+        return {}
+
+
+def save_classification_cache(cache: dict[str, dict]) -> None:
+    """Save raw classify tool inputs, keeping the most recently used entries."""
+    entries = list(cache.items())[-CLASSIFICATION_CACHE_MAX_ENTRIES:]
+    _write_cache(CLASSIFICATION_CACHE, pickle.dumps(dict(entries)))
+
+
+def build_system_prompt(bucket_descriptions: str) -> list[dict]:
+    """
+    Build the static system prompt shared by every classification request.
+
+    It is marked for prompt caching so the bucket list and instructions are
+    only processed once across all issues in a run.
+    """
 
     prompt = f"""You are a Product Operations assistant helping to triage product feedback issues.
 
-Given the following product feedback issue, classify it into the available buckets.
+Given a product feedback issue, classify it into the available buckets.
 
 ## Available Buckets:
 {bucket_descriptions}
@@ -407,66 +573,83 @@ Given the following product feedback issue, classify it into the available bucke
 ## Special Features (override parent bucket):
 - Native Datatypes: belongs to Zuzana Bednarova (not Storage owner)
 
-## Issue to Classify:
-**Title:** {title}
-
-**Description:** {description}
-
-**Labels:** {', '.join(labels) if labels else 'None'}
-
 ## Instructions:
-Analyze the issue and provide your classification in this exact JSON format:
-{{
-    "primary_bucket": "BucketName",
-    "secondary_bucket": "OtherBucketName or null if confident",
-    "confidence": "high or low",
-    "reasoning": "Brief explanation of why this bucket was chosen"
-}}
+Analyze the issue and report your classification with the classify tool.
 
 Rules:
-1. primary_bucket: The most appropriate bucket (must match a bucket name exactly)
+1. primary_bucket: The most appropriate bucket
 2. secondary_bucket: If you're torn between two buckets, provide the alternative. Set to null if confident.
 3. confidence: "high" if clearly one bucket, "low" if could reasonably be multiple buckets
-4. reasoning: 1-2 sentences explaining the classification
+4. reasoning: 1-2 sentences explaining the classification"""
 
-Respond with ONLY the JSON, nothing else."""
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
 
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=300,
-        messages=[{"role": "user", "content": prompt}]
-    )
 
-    response_text = message.content[0].text.strip()
+def build_prompt(issue: dict) -> tuple[str, str]:
+    """
+    Build the issue-specific user prompt. Returns (custom_id, prompt).
 
-    # Parse JSON response
-    try:
-        # Handle potential markdown code blocks
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-        result = json.loads(response_text)
-    except json.JSONDecodeError:
-        # Fallback: treat entire response as bucket name
-        return ClassificationResult(
-            primary_bucket=response_text,
-            secondary_bucket=None,
-            confidence="low",
-            reasoning="Failed to parse AI response",
+    Descriptions over DESCRIPTION_MAX_CHARS are cut down to their first
+    DESCRIPTION_HEAD_CHARS and last DESCRIPTION_TAIL_CHARS characters, and at
+    most MAX_PROMPT_LABELS labels are included.
+    """
+
+    title = issue.get("title", "")
+    description = issue.get("description", "") or ""
+    labels = [l["name"] for l in issue.get("labels", {}).get("nodes", [])][:MAX_PROMPT_LABELS]
+
+    if len(description) > DESCRIPTION_MAX_CHARS:
+        description = (
+            description[:DESCRIPTION_HEAD_CHARS]
+            + "\n...[truncated]...\n"
+            + description[-DESCRIPTION_TAIL_CHARS:]
         )
 
+    prompt = f"""## Issue to Classify:
+**Title:** {title}
+
+**Description:** {description}
+
+**Labels:** {', '.join(labels) if labels else 'None'}"""
+
+    # Linear issue IDs are UUIDs, which satisfy the batch custom_id format
+    return issue["id"], prompt
+
+
+def build_classify_tool(bucket_names: list[str]) -> dict:
+    """Build the classify tool whose input schema constrains Claude's answer."""
+
+    bucket_names = sorted(bucket_names)  # Stable tool definition keeps the prompt cache warm
+    return {
+        "name": CLASSIFY_TOOL_NAME,
+        "description": "Report the bucket classification for a product feedback issue.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "primary_bucket": {"type": "string", "enum": bucket_names},
+                "secondary_bucket": {"type": ["string", "null"], "enum": [*bucket_names, None]},
+                "confidence": {"type": "string", "enum": ["high", "low"]},
+                "reasoning": {"type": "string"},
+            },
+            "required": ["primary_bucket", "secondary_bucket", "confidence", "reasoning"],
+        },
+    }
+
+
+def parse_classification(
+    result: dict,
+    bucket_name_index: dict[str, str],
+    bucket_mapping: dict[str, str],
+) -> ClassificationResult:
+    """Convert the classify tool input into a ClassificationResult."""
+
     primary = result.get("primary_bucket", "UX")
     secondary = result.get("secondary_bucket")
     confidence = result.get("confidence", "low")
     reasoning = result.get("reasoning", "")
 
     # Validate primary bucket exists (case-insensitive match)
-    primary_lower = primary.lower()
-    for name in bucket_names:
-        if name.lower() == primary_lower:
-            primary = name
-            break
+    primary = bucket_name_index.get(primary.lower(), primary)
 
     # Check if secondary bucket has different owner (affects confidence)
     if secondary and confidence == "low":
@@ -484,115 +667,241 @@ Respond with ONLY the JSON, nothing else."""
     )
 
 
+async def classify_issue(
+    client: anthropic.AsyncAnthropic,
+    issue: dict,
+    bucket_descriptions: str,
+    bucket_name_index: dict[str, str],
+) -> dict:
+    """
+    Use Claude to classify a single issue into a bucket with confidence scoring.
+
+    Returns the raw classify tool input; see parse_classification.
+    """
+
+    _, prompt = build_prompt(issue)
+
+    message = await client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=CLAUDE_MAX_TOKENS,
+        tools=[build_classify_tool(list(bucket_name_index))],
+        tool_choice={"type": "tool", "name": CLASSIFY_TOOL_NAME},
+        system=build_system_prompt(bucket_descriptions),
+        messages=[{"role": "user", "content": prompt}]
+    )
+
+    return message.content[0].input
+
+
+async def classify_issues_batch(
+    client: anthropic.AsyncAnthropic,
+    issues: list[dict],
+    bucket_descriptions: str,
+    bucket_name_index: dict[str, str],
+) -> dict[str, dict]:
+    """
+    Classify many issues in one Message Batches request.
+
+    Returns raw classify tool inputs keyed by issue ID. Issues whose batch request
+    did not succeed are left out of the result. A batch still running after
+    BATCH_MAX_WAIT is cancelled and an empty result is returned.
+    """
+
+    tool = build_classify_tool(list(bucket_name_index))
+    system = build_system_prompt(bucket_descriptions)
+    batch_requests = []
+    for issue in issues:
+        custom_id, prompt = build_prompt(issue)
+        batch_requests.append({
+            "custom_id": custom_id,
+            "params": {
+                "model": CLAUDE_MODEL,
+                "max_tokens": CLAUDE_MAX_TOKENS,
+                "tools": [tool],
+                "tool_choice": {"type": "tool", "name": CLASSIFY_TOOL_NAME},
+                "system": system,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        })
+
+    batch = await client.messages.batches.create(requests=batch_requests)
+    print(f"   Submitted batch {batch.id}")
+
+    # Wait for the batch to finish processing
+    deadline = time.monotonic() + BATCH_MAX_WAIT
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline:
+            print(f"   ⚠️  Batch {batch.id} not finished after {BATCH_MAX_WAIT}s, cancelling")
+            await client.messages.batches.cancel(batch.id)
+            return {}
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    classifications = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            print(f"   ⚠️  Classification {entry.result.type} for issue {entry.custom_id}")
+            continue
+        classifications[entry.custom_id] = entry.result.message.content[0].input
+
+    return classifications
+
+
 # =============================================================================
 # MAIN LOGIC
 # =============================================================================
 
-def process_issues(
+async def process_issues(
     linear: LinearClient,
-    anthropic_client: anthropic.Anthropic,
+    anthropic_client: anthropic.AsyncAnthropic,
     issues: list[dict],
     bucket_mapping: dict[str, str],
     bucket_descriptions: str,
+    keyword_index: dict[str, str],
     team_members: list[dict],
-    team_id: str,
+    needs_review_label_id: Optional[str],
     dry_run: bool = True,
+    use_batch: bool = True,
 ) -> list[dict]:
-    """Process a list of issues and assign them to owners."""
-
-    results = []
-    bucket_names = list(set(bucket_mapping.keys()))
-
-    # Build member lookup by name
+    """
+    Process a list of issues and assign them to owners.
+
+    Issues whose title keywords name a single bucket, or whose classification
+    is cached from a previous run, skip the AI. With use_batch, the remaining
+    unassigned issues are classified upfront in a single Message Batches
+    request; otherwise, or when the batch yields no result for an issue, each
+    issue is classified on its own. Issues are handled concurrently, with at most MAX_CONCURRENT_ISSUES
+    classification or mutation calls in flight at a time.
+    """
+
+    # Lowercased bucket name -> canonical bucket name (mapping keys are already lowercase)
+    bucket_name_index = {name: name for name in bucket_mapping}
+
+    # Build member lookup by name, also keyed by the CSV spelling of mapped names
+    csv_name_by_linear_name = {
+        linear_name.lower(): csv_name.lower() for csv_name, linear_name in OWNER_NAME_MAP.items()
+    }
     member_lookup = {}
     for member in team_members:
-        member_lookup[member["name"].lower()] = member
-        # Also add normalized versions
-        for csv_name, linear_name in OWNER_NAME_MAP.items():
-            if member["name"] == linear_name:
-                member_lookup[csv_name.lower()] = member
+        key = member["name"].lower()
+        member_lookup[key] = member
+        alias = csv_name_by_linear_name.get(key)
+        if alias:
+            member_lookup[alias] = member
+
+    # Resolve what we can without the AI: title keywords, then cached results
+    keyword_pattern = build_keyword_pattern(keyword_index)
+    classification_cache = load_classification_cache()
+    cache_keys = {}
+    classifications = {}
+    to_classify = []
+    for issue in issues:
+        if issue.get("assignee"):
+            continue
+        cache_keys[issue["id"]] = classification_cache_key(issue, bucket_descriptions)
+        classification = classify_by_keywords(issue["title"], keyword_index, keyword_pattern)
+        if classification is None and cache_keys[issue["id"]] in classification_cache:
+            # Re-insert on hit so eviction drops the least recently used entries
+            result = classification_cache.pop(cache_keys[issue["id"]])
+            classification_cache[cache_keys[issue["id"]]] = result
+            classification = parse_classification(result, bucket_name_index, bucket_mapping)
+        if classification:
+            classifications[issue["id"]] = classification
+        else:
+            to_classify.append(issue)
 
-    # Get needs-review label ID (only if we'll need it)
-    needs_review_label_id = None
+    # Classify the rest of the unassigned issues in one batch
+    if use_batch and to_classify:
+        print(f"\n🤖 Classifying {len(to_classify)} issue(s) with AI (batch)...")
+        batch_results = await classify_issues_batch(
+            anthropic_client, to_classify, bucket_descriptions, bucket_name_index
+        )
+        for issue_id, result in batch_results.items():
+            classification_cache[cache_keys[issue_id]] = result
+            classifications[issue_id] = parse_classification(result, bucket_name_index, bucket_mapping)
 
-    for issue in issues:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ISSUES)
+
+    async def classify_and_assign(issue: dict, log: list[str]) -> dict:
         identifier = issue["identifier"]
         title = issue["title"]
         current_assignee = issue.get("assignee")
-        existing_labels = [l["name"] for l in issue.get("labels", {}).get("nodes", [])]
 
-        print(f"\n{'='*60}")
-        print(f"Processing: {identifier} - {title}")
+        log.append(f"\n{'='*60}")
+        log.append(f"Processing: {identifier} - {title}")
 
-        # Skip if already assigned
+        # Skip if already assigned (triage issues are pre-filtered server-side,
+        # but a specific --issue may already have an assignee)
         if current_assignee:
-            print(f"  ⏭️  Already assigned to: {current_assignee['name']}")
-            results.append({
+            log.append(f"  ⏭️  Already assigned to: {current_assignee['name']}")
+            return {
                 "identifier": identifier,
                 "title": title,
                 "action": "skipped",
                 "reason": f"Already assigned to {current_assignee['name']}",
-            })
-            continue
+            }
+
+        # Classify the issue, individually if it has no upfront result
+        # (no batch, or its batch request failed or timed out)
+        classification = classifications.get(issue["id"])
+        if classification is None:
+            log.append("  🤖 Classifying with AI...")
+            async with semaphore:
+                result = await classify_issue(
+                    anthropic_client, issue, bucket_descriptions, bucket_name_index
+                )
+            classification_cache[cache_keys[issue["id"]]] = result
+            classification = parse_classification(result, bucket_name_index, bucket_mapping)
 
-        # Classify the issue
-        print("  🤖 Classifying with AI...")
-        classification = classify_issue(
-            anthropic_client, issue, bucket_descriptions, bucket_names, bucket_mapping
-        )
         bucket = classification.primary_bucket
-        print(f"  📂 Classified as: {bucket}")
-        print(f"  📝 Reasoning: {classification.reasoning}")
+        log.append(f"  📂 Classified as: {bucket}")
+        log.append(f"  📝 Reasoning: {classification.reasoning}")
         if classification.secondary_bucket:
-            print(f"  🔀 Alternative: {classification.secondary_bucket}")
-        print(f"  🎯 Confidence: {classification.confidence}")
+            log.append(f"  🔀 Alternative: {classification.secondary_bucket}")
+        log.append(f"  🎯 Confidence: {classification.confidence}")
 
         # Check for feature overrides (e.g., Native Datatypes -> Zuzana)
-        title_lower = title.lower()
         owner_name = None
-        for feature, override_owner in FEATURE_OWNER_OVERRIDES.items():
-            if feature in title_lower:
-                owner_name = override_owner
-                print(f"  🔄 Feature override: '{feature}' -> {override_owner}")
-                break
+        match = FEATURE_OVERRIDE_RE.search(title.lower())
+        if match and match.group():
+            feature = match.group()
+            owner_name = FEATURE_OWNER_OVERRIDES[feature]
+            log.append(f"  🔄 Feature override: '{feature}' -> {owner_name}")
 
         # If no override, use bucket owner
         if not owner_name:
             owner_name = bucket_mapping.get(bucket.lower())
 
         if not owner_name:
-            print(f"  ⚠️  No owner found for bucket '{bucket}'")
-            results.append({
+            log.append(f"  ⚠️  No owner found for bucket '{bucket}'")
+            return {
                 "identifier": identifier,
                 "title": title,
                 "bucket": bucket,
                 "action": "error",
                 "reason": f"No owner found for bucket '{bucket}'",
-            })
-            continue
+            }
 
-        print(f"  👤 Owner: {owner_name}")
+        log.append(f"  👤 Owner: {owner_name}")
 
         # Find member in Linear
-        normalized_owner = normalize_owner_name(owner_name)
-        member = member_lookup.get(owner_name.lower()) or member_lookup.get(normalized_owner.lower())
+        member = member_lookup.get(owner_name.lower()) or member_lookup.get(normalize_owner_name(owner_name).lower())
 
         if not member:
-            print(f"  ⚠️  Owner '{owner_name}' not found in Linear team")
-            results.append({
+            log.append(f"  ⚠️  Owner '{owner_name}' not found in Linear team")
+            return {
                 "identifier": identifier,
                 "title": title,
                 "bucket": bucket,
                 "owner": owner_name,
                 "action": "error",
                 "reason": f"Owner '{owner_name}' not found in Linear team",
-            })
-            continue
+            }
 
         # Determine if we need to add needs-review label
         add_needs_review = classification.confidence == "low"
         if add_needs_review:
-            print(f"  ⚠️  Low confidence - will add '{NEEDS_REVIEW_LABEL}' label")
+            log.append(f"  ⚠️  Low confidence - will add '{NEEDS_REVIEW_LABEL}' label")
 
         # Build audit comment
         comment_parts = [
@@ -609,55 +918,76 @@ def process_issues(
 
         # Assign the issue
         if dry_run:
-            print(f"  🔍 DRY RUN: Would assign to {member['name']}")
+            log.append(f"  🔍 DRY RUN: Would assign to {member['name']}")
             if add_needs_review:
-                print(f"  🔍 DRY RUN: Would add label '{NEEDS_REVIEW_LABEL}'")
-            print(f"  🔍 DRY RUN: Would add comment:")
-            print(f"      {comment_body[:100]}...")
-            results.append({
+                log.append(f"  🔍 DRY RUN: Would add label '{NEEDS_REVIEW_LABEL}'")
+            log.append(f"  🔍 DRY RUN: Would add comment:")
+            log.append(f"      {comment_body[:100]}...")
+            return {
                 "identifier": identifier,
                 "title": title,
                 "bucket": bucket,
                 "owner": member["name"],
                 "confidence": classification.confidence,
                 "action": "would_assign",
-            })
-        else:
-            print(f"  ✅ Assigning to {member['name']}...")
-            try:
-                # Get label ID if needed
-                label_ids = None
-                if add_needs_review:
-                    if needs_review_label_id is None:
-                        needs_review_label_id = linear.get_or_create_label(team_id, NEEDS_REVIEW_LABEL)
-                    label_ids = [needs_review_label_id]
+            }
 
+        log.append(f"  ✅ Assigning to {member['name']}...")
+        try:
+            label_ids = [needs_review_label_id] if add_needs_review else None
+
+            async with semaphore:
                 # Assign issue (with optional label)
-                linear.assign_issue(issue["id"], member["id"], label_ids)
-                print(f"  ✅ Assigned successfully!")
-
-                # Add audit comment
-                linear.add_comment(issue["id"], comment_body)
-                print(f"  💬 Added audit comment")
-
-                results.append({
-                    "identifier": identifier,
-                    "title": title,
-                    "bucket": bucket,
-                    "owner": member["name"],
-                    "confidence": classification.confidence,
-                    "action": "assigned",
-                })
-            except Exception as e:
-                print(f"  ❌ Failed to assign: {e}")
-                results.append({
-                    "identifier": identifier,
-                    "title": title,
-                    "bucket": bucket,
-                    "owner": member["name"],
-                    "action": "error",
-                    "reason": str(e),
-                })
+                await linear.assign_issue(issue["id"], member["id"], label_ids)
+                log.append(f"  ✅ Assigned successfully!")
+
+                # Add audit comment only once the assignment it reports has succeeded
+                await linear.add_comment(issue["id"], comment_body)
+                log.append(f"  💬 Added audit comment")
+
+            return {
+                "identifier": identifier,
+                "title": title,
+                "bucket": bucket,
+                "owner": member["name"],
+                "confidence": classification.confidence,
+                "action": "assigned",
+            }
+        except Exception as e:
+            log.append(f"  ❌ Failed to assign: {e}")
+            return {
+                "identifier": identifier,
+                "title": title,
+                "bucket": bucket,
+                "owner": member["name"],
+                "action": "error",
+                "reason": str(e),
+            }
+
+    async def handle(issue: dict) -> dict:
+        # Collect the issue's output and write it in one go, so concurrently
+        # processed issues don't interleave and each issue costs a single write
+        log = []
+        try:
+            return await classify_and_assign(issue, log)
+        finally:
+            sys.stdout.write("\n".join(log) + "\n")
+            sys.stdout.flush()
+
+    outcomes = await asyncio.gather(*[handle(issue) for issue in issues], return_exceptions=True)
+    save_classification_cache(classification_cache)
+
+    results = []
+    for issue, outcome in zip(issues, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  ❌ {issue['identifier']}: Failed to process: {outcome}")
+            outcome = {
+                "identifier": issue["identifier"],
+                "title": issue["title"],
+                "action": "error",
+                "reason": str(outcome),
+            }
+        results.append(outcome)
 
     return results
 
@@ -666,10 +996,13 @@ def main():
     parser = argparse.ArgumentParser(description="Linear Product Feedback Triage Automation")
     parser.add_argument("--execute", action="store_true", help="Actually assign issues (default is dry run)")
     parser.add_argument("--issue", type=str, help="Process a specific issue by identifier (e.g., PROF-23)")
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="Classify with concurrent API calls instead of the Message Batches API",
+    )
     args = parser.parse_args()
 
-    dry_run = not args.execute
-
     # Check environment variables
     linear_api_key = os.environ.get("LINEAR_API_KEY")
     anthropic_api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -683,31 +1016,50 @@ def main():
         print("❌ ERROR: ANTHROPIC_API_KEY environment variable not set")
         return 1
 
-    # Initialize clients
-    linear = LinearClient(linear_api_key)
-    anthropic_client = anthropic.Anthropic(api_key=anthropic_api_key)
+    return asyncio.run(run(linear_api_key, anthropic_api_key, args))
+
+
+async def run(linear_api_key: str, anthropic_api_key: str, args: argparse.Namespace) -> int:
+    """Initialize clients and run the triage automation. Returns the exit code."""
+    async with LinearClient(linear_api_key) as linear:
+        async with anthropic.AsyncAnthropic(api_key=anthropic_api_key) as anthropic_client:
+            return await run_triage(linear, anthropic_client, args)
+
+
+async def run_triage(linear: LinearClient, anthropic_client: anthropic.AsyncAnthropic, args: argparse.Namespace) -> int:
+    """Run the triage automation with initialized clients. Returns the exit code."""
+
+    dry_run = not args.execute
 
     # Load bucket mapping
     print("📂 Loading bucket mapping...")
     bucket_mapping = load_bucket_mapping()
     bucket_descriptions = get_bucket_descriptions()
+    keyword_index = load_keyword_index()
     print(f"   Loaded {len(bucket_mapping)} buckets")
 
-    # Get team ID and members
-    print("👥 Fetching team info...")
-    team_id = linear.get_team_id()
-    team_members = linear.get_team_members()
-    print(f"   Found {len(team_members)} team members")
+    async def get_needs_review_label_id() -> Optional[str]:
+        # Only resolved in execute mode, as it may create the label
+        if dry_run:
+            return None
+        team_id = await linear.get_team_id()
+        return await linear.get_or_create_label(team_id, NEEDS_REVIEW_LABEL)
 
-    # Get issues to process
-    if args.issue:
-        print(f"🎯 Fetching issue {args.issue}...")
-        issue = linear.get_issue_by_identifier(args.issue)
-        issues = [issue]
-    else:
-        print("📋 Fetching Triage issues...")
-        issues = linear.get_triage_issues()
+    async def get_issues() -> list[dict]:
+        if args.issue:
+            return [await linear.get_issue_by_identifier(args.issue)]
+        return await linear.get_triage_issues()
 
+    # Fetch team members, the needs-review label and the issues to process
+    # concurrently; they are multiplexed over the shared HTTP/2 connection
+    print("👥 Fetching team info...")
+    print(f"🎯 Fetching issue {args.issue}..." if args.issue else "📋 Fetching Triage issues...")
+    team_members, needs_review_label_id, issues = await asyncio.gather(
+        linear.get_team_members(),
+        get_needs_review_label_id(),
+        get_issues(),
+    )
+    print(f"   Found {len(team_members)} team members")
     print(f"   Found {len(issues)} issue(s) to process")
 
     if not issues:
@@ -720,15 +1072,17 @@ def main():
     print(f"🚀 Starting triage automation ({mode})")
     print(f"{'='*60}")
 
-    results = process_issues(
+    results = await process_issues(
         linear=linear,
         anthropic_client=anthropic_client,
         issues=issues,
         bucket_mapping=bucket_mapping,
         bucket_descriptions=bucket_descriptions,
+        keyword_index=keyword_index,
         team_members=team_members,
-        team_id=team_id,
+        needs_review_label_id=needs_review_label_id,
         dry_run=dry_run,
+        use_batch=not (args.issue or args.no_batch),
     )
 
     # Summary